@@ -1,7 +1,14 @@
 import tkinter as tk
 import sys
 import threading
+import math
+import queue
+import re
 import time
+from types import SimpleNamespace
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from PIL import Image, ImageTk
 import os
 from tkinter import ttk
@@ -10,6 +17,34 @@ import pygame
 # --- Scaling Factor ---
 SCALE_FACTOR = 2
 
+# --- Color Helpers ---
+_HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+@lru_cache(maxsize=64)
+def get_lighter_color(hex_color):
+    """Generates a slightly lighter version of a hexadecimal color."""
+    r, g, b = [min(255, int(c * 1.2)) for c in bytes.fromhex(hex_color.lstrip('#'))]
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+@lru_cache(maxsize=64)
+def is_hex_color(color_string):
+    """Checks if a string is a valid hexadecimal color code."""
+    return isinstance(color_string, str) and _HEX_COLOR_RE.match(color_string) is not None
+
+# --- Geometry Helpers ---
+def box_face_coords(x, y, width, height, depth):
+    """Returns the (front, right, top) face coordinate tuples of a 3D box whose front face starts at (x, y).
+
+    Every derived edge is computed once and shared between the faces.
+    """
+    hd = depth * 0.5
+    x2, y2 = x + width, y + height
+    xd, yd = x2 + depth, y - hd # back edge of the right and top faces
+    y2d = y2 - hd
+    return ((x, y, x2, y2),
+            (x2, y, xd, yd, xd, y2d, x2, y2),
+            (x, y, x + depth, yd, xd, yd, x2, y))
+
 # --- Material Properties and Visuals Data ---
 MATERIALS = {
     "Brick": {"E": 20, "sigma_y": 5, "color": "#8B4513", "type": "brick", "dims": (80, 40, 40)},
@@ -17,6 +52,11 @@ MATERIALS = {
     "Packaging": {"E": 0.5, "sigma_y": 0.2, "color": "#D2B48C", "type": "box", "dims": (60, 60, 60)},
 }
 
+# Side/top face color and scaled dimensions of each material, resolved once instead of on every draw
+for _data in MATERIALS.values():
+    _data["color_light"] = get_lighter_color(_data["color"]) if is_hex_color(_data["color"]) else _data["color"]
+    _data["dims_scaled"] = tuple(dim * SCALE_FACTOR for dim in _data["dims"])
+
 # --- Machine Dimensions (Unscaled) ---
 PLATTEN_WIDTH = 100
 PLATTEN_HEIGHT = 20
@@ -24,6 +64,50 @@ PLATTEN_DEPTH = 20
 MACHINE_Y_TOP = 300
 MACHINE_Y_BOTTOM = 600
 
+# --- Machine Dimensions (Scaled) ---
+PLATTEN_WIDTH_S = PLATTEN_WIDTH * SCALE_FACTOR
+PLATTEN_HEIGHT_S = PLATTEN_HEIGHT * SCALE_FACTOR
+PLATTEN_DEPTH_S = PLATTEN_DEPTH * SCALE_FACTOR
+MACHINE_Y_TOP_S = MACHINE_Y_TOP * SCALE_FACTOR
+MACHINE_Y_BOTTOM_S = MACHINE_Y_BOTTOM * SCALE_FACTOR
+CROSSHEAD_Y_S = (MACHINE_Y_TOP + 150) * SCALE_FACTOR # initial crosshead position
+PISTON_WIDTH_S = 30 * SCALE_FACTOR
+
+# --- Simulation Timing ---
+STEP_INTERVAL = 0.05 # seconds between drawn simulation frames
+STEP_DEFORMATION = 0.125 # deformation (unscaled) per physics substep
+SUBSTEPS_PER_FRAME = 4 # physics substeps folded into each drawn frame
+RENDER_INTERVAL_MS = 16 # GUI polls for the latest simulation state at ~60 Hz
+
+# -----------------------------------------------------------------------------
+# Simulation math - pure scalar functions, free of any GUI or event state
+# -----------------------------------------------------------------------------
+# One simulation step as handed from Logic to the GUI (dimensions scaled)
+SimState = namedtuple("SimState", "material_height material_width material_depth crosshead_new_y current_force peak_stress test_type")
+
+def compute_deformation_state(E, sigma_y, H0, W0, D0, deformation, sign):
+    """Returns (stress, force, height, width, depth) of a specimen at a given deformation.
+
+    `sign` is -1 for compression and +1 for tension. The specimen keeps its
+    volume, so width and depth scale with sqrt(H0 / height).
+    """
+    stress = E * (deformation / H0)
+    if stress > sigma_y:
+        stress = sigma_y + 0.1 * (stress - sigma_y)
+    
+    new_height = H0 + sign * deformation
+    if new_height > 0:
+        dim_factor = (H0 / new_height)**0.5
+        new_width = W0 * dim_factor
+        new_depth = D0 * dim_factor
+    else:
+        new_width = W0 * 1.5
+        new_depth = D0 * 1.5
+    
+    # Compression loads the original section, tension the necked one
+    area = new_width * new_depth if sign > 0 else W0 * D0
+    return stress, stress * area, new_height, new_width, new_depth
+
 # -----------------------------------------------------------------------------
 # Class 1: EventManager - Decouples the GUI and Logic classes
 # -----------------------------------------------------------------------------
@@ -48,17 +132,29 @@ class EventManager:
 # Class 2: Logic - Responsible for simulation, calculations, and state management
 # -----------------------------------------------------------------------------
 class Logic:
-    def __init__(self, root, event_manager):
+    def __init__(self, root, event_manager, state_slot):
         self.root = root
         self.event_manager = event_manager
-        
-        self.is_running_event = threading.Event()
-        self.simulation_thread = None
+        self._state_slot = state_slot # single-slot queue holding the latest step for the GUI
+        
+        # The test steps on the run_loop worker thread. _cond guards the test
+        # state it shares with the Tk thread and wakes it on start/pause/stop.
+        self._running = False
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event() # set once on shutdown to end run_loop
+        self._finished = queue.Queue() # finish messages from the worker, read on the Tk thread
         self.selected_material_data = None
+        self.gui_needs_updates = False # True while the GUI shows a specimen in the machine
+        self._after_id = None
+        
+        # Precomputed test, filled by start_test for the selected material
+        self._trajectory = ()
+        self._frame_count = 0
+        self._step_index = 0
         
         # Initial machine state (used for calculations)
-        self.initial_crosshead_y = (MACHINE_Y_TOP + 150) * SCALE_FACTOR
-        self.initial_platen_y = MACHINE_Y_BOTTOM * SCALE_FACTOR
+        self.initial_crosshead_y = CROSSHEAD_Y_S
+        self.initial_platen_y = MACHINE_Y_BOTTOM_S
         self.current_crosshead_y = self.initial_crosshead_y
         self.actuator_x = 0 # Will be set by GUI
         self.actuator_y = MACHINE_Y_TOP + 10
@@ -75,9 +171,27 @@ class Logic:
         self.original_width = 0
         self.original_depth = 0
         
-        # Sound setup
-        pygame.mixer.init()
+        # Sound setup - the mixer is only started on first playback, and all
+        # pygame calls run on a worker so a slow audio device cannot stall Tk
         self.machine_sound = None
+        self._mixer_ready = False
+        self._sound_commands = queue.Queue()
+        threading.Thread(target=self._sound_worker, daemon=True).start()
+            
+        self.setup_event_listeners()
+        
+    def _ensure_mixer(self):
+        """Initializes the mixer and loads the machine sound on first use."""
+        if self._mixer_ready:
+            return self.machine_sound
+        self._mixer_ready = True
+        
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            print("Sound error: Could not initialize the audio mixer.")
+            return None
+        
         if os.path.exists('sound.wav'):
             try:
                 self.machine_sound = pygame.mixer.Sound('sound.wav')
@@ -85,8 +199,18 @@ class Logic:
                 print("Sound error: Could not load 'machine_sound.wav'.")
         else:
             print("Info: 'machine_sound.wav' not found. Sound effects will be disabled.")
-            
-        self.setup_event_listeners()
+        return self.machine_sound
+
+    def _sound_worker(self):
+        """Plays and stops the machine sound as commands arrive on the queue."""
+        while True:
+            command = self._sound_commands.get()
+            if command == "play":
+                sound = self._ensure_mixer()
+                if sound:
+                    sound.play(loops=-1)
+            elif command == "stop" and self.machine_sound:
+                self.machine_sound.stop()
         
     def setup_event_listeners(self):
         """Subscribe to events from the GUI."""
@@ -96,7 +220,9 @@ class Logic:
         self.event_manager.subscribe("resume_test", self.resume_test)
         self.event_manager.subscribe("reset_app", self.reset_state)
         self.event_manager.subscribe("material_dropped", self.set_material_data)
+        self.event_manager.subscribe("material_removed", self.clear_gui_updates)
         self.event_manager.subscribe("test_type_changed", self.set_test_type)
+        self.event_manager.subscribe("stop_test", self.shutdown)
 
     def set_test_type(self, data):
         self.test_type = data["type"]
@@ -104,7 +230,20 @@ class Logic:
         
     def set_material_data(self, data):
         """Sets the selected material data based on the event."""
-        self.selected_material_data = data["material_data"]
+        if self._running:
+            # The running test belongs to the previous drop; it is paused, not finished
+            self.pause_test()
+        with self._cond:
+            self.selected_material_data = data["material_data"]
+            self.gui_needs_updates = True
+            # A test prepared for the previous material does not apply to this one
+            self._trajectory = ()
+            self._frame_count = 0
+            self._step_index = 0
+
+    def clear_gui_updates(self, data=None):
+        """Stops publishing steps once the GUI no longer shows the specimen in the machine."""
+        self.gui_needs_updates = False
 
     def calibrate_machine(self, data=None):
         if not self.selected_material_data:
@@ -113,7 +252,7 @@ class Logic:
         material_height = self.selected_material_data["dims"][1]
         
         if self.test_type == "Compression":
-            calibration_y = self.initial_platen_y - (material_height * SCALE_FACTOR) - (PLATTEN_HEIGHT * SCALE_FACTOR)
+            calibration_y = self.initial_platen_y - (material_height * SCALE_FACTOR) - PLATTEN_HEIGHT_S
             self.current_crosshead_y = calibration_y
             self.event_manager.notify("update_crosshead", {"y": calibration_y, "test_type": self.test_type})
         elif self.test_type == "Tensile":
@@ -124,176 +263,208 @@ class Logic:
         self.event_manager.notify("update_message", {"text": "Machine calibrated. Press 'Start Test' to begin.", "color": "green"})
 
     def start_test(self, data=None):
-        if self.is_running_event.is_set() or not self.selected_material_data:
+        if self._running or not self.selected_material_data:
             return
         
+        with self._cond:
+            self._prepare_test()
+            self._running = True
+            self._cond.notify()
+        
+        self.event_manager.notify("set_status", "running")
+        self._sound_commands.put("play")
+        if self._after_id is None:
+            self._watch_for_finish()
+
+    def _prepare_test(self):
+        """Precomputes the trajectory of the selected material for the current test type."""
         self.original_height = self.selected_material_data["dims"][1]
         self.original_width = self.selected_material_data["dims"][0]
         self.original_depth = self.selected_material_data["dims"][2]
+        
+        # Per-test constants, computed once instead of on every simulation tick
+        self._E = self.selected_material_data["E"] * 1000 # GPa to MPa
+        self._sigma_y = self.selected_material_data["sigma_y"]
+        self._initial_platen_y = self.initial_platen_y
+        
         self.current_deformation = 0
         self.current_force = 0
         self.peak_force = 0
         self.peak_stress = 0
         
-        self.is_running_event.set()
-        self.event_manager.notify("set_status", "running")
-        
-        if self.machine_sound:
-            self.machine_sound.play(loops=-1)
-        
+        # The test type is resolved once: -1 shortens the specimen, +1 stretches it
         if self.test_type == "Compression":
-            self.run_compression_simulation_step()
-        elif self.test_type == "Tensile":
-            self.run_tensile_simulation_step()
+            sign, limit = -1, self.original_height - 10
+            self._finish_message = "The compression test has finished."
+        else:
+            sign, limit = 1, self.original_height * 2
+            self._finish_message = "The tensile test has finished (material broke)."
+        
+        # With a fixed step size the number of substeps and drawn frames is
+        # known up front, and the whole deterministic test is precomputed
+        step_count = max(0, math.ceil(limit / STEP_DEFORMATION))
+        self._frame_count = math.ceil(step_count / SUBSTEPS_PER_FRAME)
+        self._trajectory = self._build_trajectory(sign, step_count)
+        self._step_index = 0
+        self._t0 = time.monotonic()
+        # A finish left over from an earlier test must not end this one
+        while not self._finished.empty():
+            self._finished.get_nowait()
             
     def pause_test(self, data=None):
-        self.is_running_event.clear()
-        if self.machine_sound:
-            self.machine_sound.stop()
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._sound_commands.put("stop")
         self.event_manager.notify("set_status", "paused")
         self.event_manager.notify("update_message", {"text": "Test paused. Press Resume Test to continue.", "color": "orange"})
 
     def resume_test(self, data=None):
-        if not self.is_running_event.is_set():
-            self.is_running_event.set()
+        if not self._trajectory:
+            # Paused before any test was prepared for this material: start one
+            self.start_test()
+            return
+        if not self._running:
+            with self._cond:
+                # Re-anchor the schedule so the paused time is not caught up on
+                self._t0 = time.monotonic() - self._step_index * STEP_INTERVAL
+                self._running = True
+                self._cond.notify()
             self.event_manager.notify("set_status", "running")
-            if self.machine_sound:
-                self.machine_sound.play(loops=-1)
+            self._sound_commands.put("play")
             self.event_manager.notify("update_message", {"text": "Test resumed.", "color": "green"})
-            if self.test_type == "Compression":
-                self.run_compression_simulation_step()
-            elif self.test_type == "Tensile":
-                self.run_tensile_simulation_step()
+            if self._after_id is None:
+                self._watch_for_finish()
         
     def stop_test(self):
-        self.is_running_event.clear()
-        if self.machine_sound:
-            self.machine_sound.stop()
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self._sound_commands.put("stop")
+
+    def shutdown(self, data=None):
+        """Stops the test and ends the worker thread; called when the window closes."""
+        self._stop_event.set()
+        self.stop_test()
 
     def reset_state(self, data=None):
         self.stop_test()
-        self.selected_material_data = None
-        self.current_deformation = 0
-        self.current_force = 0
-        self.peak_force = 0
-        self.peak_stress = 0
-        self.current_crosshead_y = self.initial_crosshead_y
+        with self._cond:
+            self.selected_material_data = None
+            self.gui_needs_updates = False
+            self._trajectory = ()
+            self._frame_count = 0
+            self._step_index = 0
+            self.current_deformation = 0
+            self.current_force = 0
+            self.peak_force = 0
+            self.peak_stress = 0
+            self.current_crosshead_y = self.initial_crosshead_y
+            # Drop a step that the GUI has not drawn yet, so it cannot land after the reset
+            try:
+                self._state_slot.get_nowait()
+            except queue.Empty:
+                pass
         self.event_manager.notify("full_reset", {"test_type": self.test_type, "initial_crosshead_y": self.initial_crosshead_y})
 
-    def run_compression_simulation_step(self):
-        if not self.is_running_event.is_set():
-            return
-        
-        E = self.selected_material_data["E"] * 1000 # GPa to MPa
-        sigma_y = self.selected_material_data["sigma_y"]
-        
-        step_deformation = 0.5
-        
-        if self.current_deformation >= self.original_height - 10:
-            self.event_manager.notify("set_status", "finished")
-            self.event_manager.notify("update_message", {"text": "The compression test has finished.", "color": "green"})
-            self.stop_test()
-            return
-            
-        self.current_deformation += step_deformation
-        
-        current_strain = self.current_deformation / self.original_height
-        current_stress = E * current_strain
-        
-        if current_stress > sigma_y:
-            current_stress = sigma_y + 0.1 * (current_stress - sigma_y)
-        
-        area = self.original_width * self.original_depth
-        self.current_force = current_stress * area
-        
-        if self.current_force > self.peak_force:
-            self.peak_force = self.current_force
-            self.peak_stress = current_stress
+    def _build_trajectory(self, sign, step_count):
+        """Precomputes the per-frame simulation state for the current test.
 
-        new_height = self.original_height - self.current_deformation
-        
-        if new_height > 0:
-            dim_factor = (self.original_height / new_height)**0.5
-            new_width = self.original_width * dim_factor
-            new_depth = self.original_depth * dim_factor
-        else:
-            new_width = self.original_width * 1.5
-            new_depth = self.original_depth * 1.5
-        
-        new_crosshead_y = self.initial_platen_y - (new_height * SCALE_FACTOR + PLATTEN_HEIGHT * SCALE_FACTOR)
-        self.current_crosshead_y = new_crosshead_y
-        
-        data = {
-            "material_height": new_height * SCALE_FACTOR,
-            "material_width": new_width * SCALE_FACTOR,
-            "material_depth": new_depth * SCALE_FACTOR,
-            "crosshead_new_y": self.current_crosshead_y,
-            "current_force": self.current_force,
-            "peak_stress": self.peak_stress,
-            "test_type": self.test_type
-        }
-        
-        self.event_manager.notify("update_data", data)
-        self.root.after(50, self.run_compression_simulation_step)
-
-    def run_tensile_simulation_step(self):
-        if not self.is_running_event.is_set():
-            return
+        `sign` is -1 for compression and +1 for tension; `step_count` is the
+        number of STEP_DEFORMATION substeps until the test ends. Only every
+        SUBSTEPS_PER_FRAME-th state (and the final one) is kept for drawing.
+        """
+        H0, W0, D0 = self.original_height, self.original_width, self.original_depth
+        E, sigma_y = self._E, self._sigma_y
+        
+        trajectory = []
+        peak_force = 0
+        peak_stress = 0
+        for step in range(1, step_count + 1):
+            deformation = step * STEP_DEFORMATION
+            stress, force, new_height, new_width, new_depth = compute_deformation_state(E, sigma_y, H0, W0, D0, deformation, sign)
             
-        E = self.selected_material_data["E"] * 1000
-        sigma_y = self.selected_material_data["sigma_y"]
-        
-        step_deformation = 0.5
+            if force > peak_force:
+                peak_force = force
+                peak_stress = stress
+            
+            crosshead_y = self._initial_platen_y - (new_height * SCALE_FACTOR + PLATTEN_HEIGHT_S)
+            trajectory.append((deformation, new_height * SCALE_FACTOR, new_width * SCALE_FACTOR, new_depth * SCALE_FACTOR, crosshead_y, force, peak_force, peak_stress))
         
-        if self.current_deformation >= self.original_height * 2:
-            self.event_manager.notify("set_status", "finished")
-            self.event_manager.notify("update_message", {"text": "The tensile test has finished (material broke).", "color": "green"})
-            self.stop_test()
+        frames = trajectory[SUBSTEPS_PER_FRAME - 1::SUBSTEPS_PER_FRAME]
+        if len(trajectory) % SUBSTEPS_PER_FRAME:
+            frames.append(trajectory[-1])
+        return frames
+
+    def run_loop(self):
+        """Steps the running test on schedule until shutdown. Runs on a worker thread."""
+        with self._cond:
+            while not self._stop_event.is_set():
+                if not self._running:
+                    self._cond.wait()
+                    continue
+                delay = self._run_simulation_step()
+                if delay is not None:
+                    self._cond.wait(delay)
+
+    def _watch_for_finish(self):
+        """Announces the end of the test once the worker reports it; polls on the Tk thread."""
+        try:
+            message = self._finished.get_nowait()
+        except queue.Empty:
+            self._after_id = self.root.after(50, self._watch_for_finish)
             return
-        
-        self.current_deformation += step_deformation
-        
-        current_strain = self.current_deformation / self.original_height
-        current_stress = E * current_strain
-        
-        if current_stress > sigma_y:
-            current_stress = sigma_y + 0.1 * (current_stress - sigma_y)
+        self._after_id = None
+        self.event_manager.notify("set_status", "finished")
+        self.event_manager.notify("update_message", {"text": message, "color": "green"})
 
-        new_height = self.original_height + self.current_deformation
-        dim_factor = (self.original_height / new_height)**0.5
-        new_width = self.original_width * dim_factor
-        new_depth = self.original_depth * dim_factor
-        
-        area = new_width * new_depth
-        self.current_force = current_stress * area
-        
-        if self.current_force > self.peak_force:
-            self.peak_force = self.current_force
-            self.peak_stress = current_stress
+    def _run_simulation_step(self):
+        """Publishes the step that is due now; returns the seconds until the next one, or None when done.
+
+        Called by run_loop with _cond held.
+        """
+        if self._step_index >= self._frame_count:
+            self._running = False
+            self._sound_commands.put("stop")
+            self._finished.put(self._finish_message)
+            return None
+        
+        # Steps are due on a fixed schedule from _t0; if the worker was late,
+        # skip ahead to the step that is due now instead of drifting behind
+        now = time.monotonic()
+        due = int((now - self._t0) / STEP_INTERVAL) + 1
+        self._step_index = min(max(due, self._step_index + 1), self._frame_count)
+        
+        (self.current_deformation, material_height, material_width, material_depth,
+         self.current_crosshead_y, self.current_force, self.peak_force, self.peak_stress) = self._trajectory[self._step_index - 1]
+        
+        # Nothing is built for the GUI while no specimen is shown in the machine
+        if self.gui_needs_updates:
+            # An immutable state per step, since the GUI reads it on the Tk thread
+            # while this thread moves on to the next step
+            state = SimState(material_height, material_width, material_depth, self.current_crosshead_y,
+                             self.current_force, self.peak_stress, self.test_type)
             
-        new_crosshead_y = self.initial_platen_y - (new_height * SCALE_FACTOR) - (PLATTEN_HEIGHT*SCALE_FACTOR)
-        self.current_crosshead_y = new_crosshead_y
-        
-        data = {
-            "material_height": new_height * SCALE_FACTOR,
-            "material_width": new_width * SCALE_FACTOR,
-            "material_depth": new_depth * SCALE_FACTOR,
-            "crosshead_new_y": self.current_crosshead_y,
-            "current_force": self.current_force,
-            "peak_stress": self.peak_stress,
-            "test_type": self.test_type
-        }
-
-        self.event_manager.notify("update_data", data)
-        self.root.after(50, self.run_tensile_simulation_step)
+            # Only the newest step is kept; the GUI draws whatever is there on its own cadence
+            try:
+                self._state_slot.get_nowait()
+            except queue.Empty:
+                pass
+            self._state_slot.put_nowait(state)
+        
+        return max(0.001, self._t0 + self._step_index * STEP_INTERVAL - now)
         
 # -----------------------------------------------------------------------------
 # Class 3: GUI - Responsible for all drawing and user interaction
 # -----------------------------------------------------------------------------
 class GUI:
-    def __init__(self, root, event_manager):
+    def __init__(self, root, event_manager, state_slot):
         self.root = root
         self.event_manager = event_manager
+        self._state_slot = state_slot # latest simulation step, drained by _pump()
         
         self.root.title("Stauchdruckpresse Simulator")
         self.root.geometry(f"{1000 * SCALE_FACTOR}x{650 * SCALE_FACTOR}")
@@ -302,9 +473,37 @@ class GUI:
         self.drag_data = {"item": None, "x": 0, "y": 0}
         self.logo_image = None
         self.material_tags = {}
+        self.material_items = {} # drag tag -> {"front", "right", "top", "label"} canvas item ids
+        self._draggable_bboxes = {} # drag tag -> (x1, y1, x2, y2), topmost last
+        self._specimen_items = None # face item ids of the material placed in the machine
+        self._machine_ids = {} # machine part name -> canvas item id(s)
+        self._zorder_dirty = True # set when items are restacked; cleared by _restack()
+        self._batch_depth = 0 # nesting level of batch_updates()
+        self._last_force = self._last_stress = self._last_height = None # rounded values on the data labels
+        
+        # Drawing attributes of each material, resolved once for the drag handlers
+        self._mat_cache = {}
+        self._tag_to_name = {} # drag tag -> material name
+        for name, data in MATERIALS.items():
+            self._tag_to_name[f"draggable_{name}"] = name
+            w_scaled, h_scaled, _ = data["dims_scaled"]
+            self._mat_cache[name] = SimpleNamespace(
+                name=name, data=data, color=data["color"], lighter_color=data["color_light"], type=data["type"],
+                dims_scaled=data["dims_scaled"], w_scaled=w_scaled, h_scaled=h_scaled)
+        
+        # Palette slot of each material, stacked top to bottom with room for its label
+        self._palette_y_offsets = {}
+        y_offset = 0
+        for name, mat in self._mat_cache.items():
+            self._palette_y_offsets[name] = y_offset
+            y_offset += mat.h_scaled + 80 * SCALE_FACTOR
         self.selected_material_tag = None
         self.test_type_var = tk.StringVar(value="Compression")
         
+        # The pause button toggles between these two commands
+        self._on_pause = partial(self.event_manager.notify, "pause_test")
+        self._on_resume = partial(self.event_manager.notify, "resume_test")
+        
         self.setup_ui()
         self.draw_logo()
         self.setup_event_listeners()
@@ -329,14 +528,54 @@ class GUI:
         self.actuator_y = MACHINE_Y_TOP + 10
         self.actuator_width = 40
         self.actuator_height = 20
-        self.initial_crosshead_y = (MACHINE_Y_TOP + 150) * SCALE_FACTOR
-        self.initial_platen_y = MACHINE_Y_BOTTOM * SCALE_FACTOR
+        self.initial_crosshead_y = CROSSHEAD_Y_S
+        self.initial_platen_y = MACHINE_Y_BOTTOM_S
         
         self.machine_area = {"x1": self.machine_x1, "y1": self.machine_y_top, "x2": self.machine_x2, "y2": self.machine_y_bottom}
+        self._recompute_layout_cache()
         
         # Draw the machine and materials immediately after initialization
         self.draw_machine()
         self.draw_materials_to_drag()
+        
+        self._next_tick = time.monotonic() # deadline of the next render tick
+        self._pump()
+
+    def _recompute_layout_cache(self):
+        """Caches the scaled platen/actuator geometry that the drag and update handlers reuse.
+
+        The machine is laid out at fixed canvas coordinates, so this only has
+        to run again if the machine_* / actuator_* attributes change. The platen
+        size itself comes from the PLATTEN_*_S constants.
+        """
+        self._platen_x_scaled = (self.machine_x1 + self.machine_x2) / 2 * SCALE_FACTOR - PLATTEN_WIDTH_S / 2
+        self._platen_center_x_scaled = self._platen_x_scaled + PLATTEN_WIDTH_S / 2
+        self._actuator_x_center_scaled = self.actuator_x * SCALE_FACTOR + self.actuator_width * SCALE_FACTOR / 2
+        self._piston_top_y_scaled = self.actuator_y * SCALE_FACTOR + self.actuator_height * SCALE_FACTOR
+        self._piston_x1_scaled = self._actuator_x_center_scaled - PISTON_WIDTH_S / 2
+        self._piston_x2_scaled = self._actuator_x_center_scaled + PISTON_WIDTH_S / 2
+        self._machine_x1_scaled = self.machine_area["x1"] * SCALE_FACTOR
+        self._machine_x2_scaled = self.machine_area["x2"] * SCALE_FACTOR
+
+    def _pump(self):
+        """Draws the latest simulation step, if a new one arrived, and polls again.
+
+        Ticks follow a fixed monotonic schedule, so time spent drawing does not
+        push later ticks back. After a stall the schedule restarts from now
+        instead of firing a burst of catch-up ticks.
+        """
+        try:
+            state = self._state_slot.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.update_gui(state)
+        
+        now = time.monotonic()
+        self._next_tick += RENDER_INTERVAL_MS / 1000
+        if self._next_tick < now:
+            self._next_tick = now
+        self.root.after(max(1, int((self._next_tick - now) * 1000)), self._pump)
 
     def on_closing(self):
         self.event_manager.notify("stop_test")
@@ -344,8 +583,7 @@ class GUI:
     
     def setup_event_listeners(self):
         """Subscribe to events from the Logic class."""
-        self.event_manager.subscribe("update_data", self.update_gui)
-        self.event_manager.subscribe("update_crosshead", self.update_crosshead_position)
+        self.event_manager.subscribe("update_crosshead", self.on_crosshead_event)
         self.event_manager.subscribe("set_status", self.set_status)
         self.event_manager.subscribe("update_message", self.display_message)
         self.event_manager.subscribe("full_reset", self.full_reset)
@@ -410,266 +648,268 @@ class GUI:
         
         self.start_button = ttk.Button(control_panel, text="Start Test", command=lambda: self.event_manager.notify("start_test"), state=tk.DISABLED, style='Dark.TButton')
         self.start_button.pack(pady=10, fill=tk.X)
-        self.pause_button = ttk.Button(control_panel, text="Pause Test", command=lambda: self.event_manager.notify("pause_test"), state=tk.DISABLED, style='Dark.TButton')
+        self.pause_button = ttk.Button(control_panel, text="Pause Test", command=self._on_pause, state=tk.DISABLED, style='Dark.TButton')
         self.pause_button.pack(pady=10, fill=tk.X)
         self.reset_button = ttk.Button(control_panel, text="New Test", command=lambda: self.event_manager.notify("reset_app"), style='Dark.TButton')
         self.reset_button.pack(pady=10, fill=tk.X)
-        self.exit_button = ttk.Button(control_panel, text="Exit", command=self.root.destroy, style='Dark.TButton')
+        self.exit_button = ttk.Button(control_panel, text="Exit", command=self.on_closing, style='Dark.TButton')
         self.exit_button.pack(pady=20, fill=tk.X)
 
     def draw_logo(self):
+        """Loads the logo on a worker thread so the window can appear right away."""
+        self._logo_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._load_logo_async, daemon=True).start()
+        self.root.after(50, self._install_logo)
+
+    def _load_logo_async(self):
+        """Decodes and resizes the logo off the Tk thread; Tk objects are built in _install_logo."""
         logo_path = 'PAC.jpg'
         try:
             pil_image = Image.open(logo_path)
-            pil_image = pil_image.resize((int(100 * SCALE_FACTOR), int(100 * SCALE_FACTOR)))
-            self.logo_image = ImageTk.PhotoImage(pil_image)
-            logo_label = ttk.Label(self.root, image=self.logo_image)
-            logo_label.place(relx=1.0, rely=0, anchor=tk.NE, x=-20, y=20)
+            pil_image = pil_image.resize((int(100 * SCALE_FACTOR), int(100 * SCALE_FACTOR)), Image.BILINEAR)
+            self._logo_queue.put(("image", pil_image))
         except FileNotFoundError:
-            self.display_message({"text": "Error: Logo file 'PAC.jpg' not found. Please add the file to the project directory.", "color": "red"})
+            self._logo_queue.put(("error", "Error: Logo file 'PAC.jpg' not found. Please add the file to the project directory."))
         except Exception as e:
-            self.display_message({"text": f"Error loading logo: {e}", "color": "red"})
+            self._logo_queue.put(("error", f"Error loading logo: {e}"))
+
+    def _install_logo(self):
+        try:
+            kind, result = self._logo_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._install_logo)
+            return
+        
+        if kind == "error":
+            self.display_message({"text": result, "color": "red"})
+            return
+        self.logo_image = ImageTk.PhotoImage(result)
+        logo_label = ttk.Label(self.root, image=self.logo_image)
+        logo_label.place(relx=1.0, rely=0, anchor=tk.NE, x=-20, y=20)
 
     def display_message(self, data):
         self.message_label.config(text=data["text"], foreground=data["color"])
 
-    def get_lighter_color(self, hex_color):
-        """Generates a slightly lighter version of a hexadecimal color."""
-        hex_color = hex_color.lstrip('#')
-        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        r, g, b = [min(255, int(c * 1.2)) for c in rgb]
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    def is_hex_color(self, color_string):
-        """Checks if a string is a valid hexadecimal color code."""
-        if not isinstance(color_string, str) or not color_string.startswith('#'):
-            return False
-        try:
-            int(color_string[1:], 16)
-            return len(color_string) == 7
-        except ValueError:
-            return False
-
     def _draw_3d_box(self, x, y, width, height, depth, tags, fill_color, outline_color):
         box_color_front = fill_color
-        box_color_top_side = self.get_lighter_color(fill_color) if self.is_hex_color(fill_color) else fill_color
+        box_color_top_side = get_lighter_color(fill_color) if is_hex_color(fill_color) else fill_color
+        front_pts, right_pts, top_pts = box_face_coords(x, y, width, height, depth)
         
         # Front face rectangle
-        self.canvas.create_rectangle(x, y, x + width, y + height, fill=box_color_front, outline=outline_color, width=2, tags=tags)
+        front = self.canvas.create_rectangle(*front_pts, fill=box_color_front, outline=outline_color, width=2, tags=tags)
         
         # Right side face polygon 
-        self.canvas.create_polygon(
-            x + width, y, 
-            x + width + depth, y - depth/2, 
-            x + width + depth, y + height - depth/2, 
-            x + width, y + height, 
-            fill=box_color_top_side, outline=outline_color, width=2, tags=tags
-        )
+        right = self.canvas.create_polygon(*right_pts, fill=box_color_top_side, outline=outline_color, width=2, tags=tags)
         
         # Top face polygon (for a complete 3D look)
-        self.canvas.create_polygon(
-            x, y, 
-            x + depth, y - depth/2, 
-            x + width + depth, y - depth/2, 
-            x + width, y, 
-            fill=box_color_top_side, outline=outline_color, width=2, tags=tags
-        )
-        return tags
+        top = self.canvas.create_polygon(*top_pts, fill=box_color_top_side, outline=outline_color, width=2, tags=tags)
+        return front, right, top
 
     #22222#
 
     def _draw_3d_piston_rod(self, x1, y1, x2, y2, test_type):
-        width = 30 * SCALE_FACTOR
+        width = PISTON_WIDTH_S
         x_center = x1
         y_top = min(y1, y2)
         height = abs(y2 - y1)
         fill_color = "silver"
         outline_color = "gray"
 
-        if self.canvas.find_withtag("actuator_piston"):
-            self.canvas.coords("actuator_piston", x_center - width/2, y_top, x_center + width/2, y_top + height)
+        self._upsert_rect(self._machine_ids, "actuator_piston", (x_center - width/2, y_top, x_center + width/2, y_top + height), fill=fill_color, outline=outline_color, tags="actuator_piston")
+
+    def _upsert_rect(self, registry, role, coords, **style):
+        """Moves the rectangle stored under `role` in `registry`, creating it with `style` on first use."""
+        item = registry.get(role)
+        if item is None:
+            registry[role] = item = self.canvas.create_rectangle(*coords, **style)
+        else:
+            self.canvas.coords(item, *coords)
+        return item
+
+    def _upsert_polygon(self, registry, role, coords, **style):
+        """Moves the polygon stored under `role` in `registry`, creating it with `style` on first use."""
+        item = registry.get(role)
+        if item is None:
+            registry[role] = item = self.canvas.create_polygon(*coords, **style)
         else:
-            self.canvas.create_rectangle(x_center - width/2, y_top, x_center + width/2, y_top + height, fill=fill_color, outline=outline_color, tags="actuator_piston")
+            self.canvas.coords(item, *coords)
+        return item
 
     def draw_machine(self):
+        """Draws the machine parts back to front, so no re-stacking is needed.
+
+        Required order (bottom to top): machine_frame, machine_base, col1, col2,
+        machine_top_beam, machine_bottom_beam, crosshead_platen, bottom_platen,
+        actuator_piston, actuator. Materials are drawn afterwards, above all of them.
+        """
         main_frame_color = "#ECF0F1"
         accent_color = "#2C3E50"
         actuator_color = "#3498DB"
         outline_color = "#7F8C8D"
         
-        base_x1, base_y1 = self.machine_x1 * SCALE_FACTOR, self.machine_y_bottom * SCALE_FACTOR
+        base_x1, base_y1 = self.machine_x1 * SCALE_FACTOR, MACHINE_Y_BOTTOM_S
         base_width, base_height, base_depth = (self.machine_x2 - self.machine_x1) * SCALE_FACTOR, 80 * SCALE_FACTOR, 50 * SCALE_FACTOR
+        ids = self._machine_ids
         
-        # Draw base
-        self._draw_3d_box(base_x1, base_y1 + 200, base_width, base_height, base_depth, "machine_base", main_frame_color, outline_color)
         #------------------------------------
         def _draw_3d_platen(x, y, tags):
             platen_color_front = "#3498DB"
-            platen_color_top_side = self.get_lighter_color(platen_color_front)
+            platen_color_top_side = get_lighter_color(platen_color_front)
             outline_color = "#2980B9"
             
-            width = self.platen_width * SCALE_FACTOR
-            height = self.platen_height * SCALE_FACTOR
-            depth = self.platen_depth * SCALE_FACTOR
+            front_pts, right_pts, top_pts = box_face_coords(x, y, PLATTEN_WIDTH_S, PLATTEN_HEIGHT_S, PLATTEN_DEPTH_S)
 
             # Draw the front face (this was the missing part)
-            self.canvas.create_rectangle(x, y, x + width, y + height, fill=platen_color_front, outline=outline_color, width=2, tags=tags)
+            front = self.canvas.create_rectangle(*front_pts, fill=platen_color_front, outline=outline_color, width=2, tags=tags)
 
             # Right side face
-            self.canvas.create_polygon(x + width, y, x + width + depth, y - depth/2, x + width + depth, y + height - depth/2, x + width, y + height, fill=platen_color_top_side, outline=outline_color, width=2, tags=tags)
+            right = self.canvas.create_polygon(*right_pts, fill=platen_color_top_side, outline=outline_color, width=2, tags=tags)
             
             # Top face
-            self.canvas.create_polygon(x, y, x + depth, y - depth/2, x + width + depth, y - depth/2, x + width, y, fill=platen_color_top_side, outline=outline_color, width=2, tags=tags)
-        # 
-        # 
-        # 
+            top = self.canvas.create_polygon(*top_pts, fill=platen_color_top_side, outline=outline_color, width=2, tags=tags)
+            return front, right, top
         # -----------------------------   
-
-            
+        
+        # Draw the main machine frame first; everything else sits in front of it
+        ids["machine_frame"] = self._draw_3d_box(base_x1, base_y1 - 400 * SCALE_FACTOR, base_width, 400 * SCALE_FACTOR, base_depth, "machine_frame", main_frame_color, outline_color)
+        
+        # Draw base
+        ids["machine_base"] = self._draw_3d_box(base_x1, base_y1 + 200, base_width, base_height, base_depth, "machine_base", main_frame_color, outline_color)
         
         # Draw columns (vertical bars) - now drawn AFTER the base
         col_width = 30 * SCALE_FACTOR
         col_height = 200 * SCALE_FACTOR
-        self._draw_3d_box(base_x1 +0.1 * SCALE_FACTOR, base_y1 + 40 * SCALE_FACTOR, col_width, col_height, 10 * SCALE_FACTOR, "col1", accent_color, outline_color) # Adjusted y for sitting on base
-        self._draw_3d_box(base_x1 + base_width - 40 * SCALE_FACTOR, base_y1 + 40 * SCALE_FACTOR, col_width, col_height, 10 * SCALE_FACTOR, "col2", accent_color, outline_color) # Adjusted y for sitting on base
+        ids["col1"] = self._draw_3d_box(base_x1 +0.1 * SCALE_FACTOR, base_y1 + 40 * SCALE_FACTOR, col_width, col_height, 10 * SCALE_FACTOR, "col1", accent_color, outline_color) # Adjusted y for sitting on base
+        ids["col2"] = self._draw_3d_box(base_x1 + base_width - 40 * SCALE_FACTOR, base_y1 + 40 * SCALE_FACTOR, col_width, col_height, 10 * SCALE_FACTOR, "col2", accent_color, outline_color) # Adjusted y for sitting on base
 
         # Draw top and bottom beams
-        top_beam_y = (self.machine_y_top - 40) * SCALE_FACTOR
-        self._draw_3d_box(base_x1, top_beam_y, base_width, 40 * SCALE_FACTOR, base_depth, "machine_top_beam", accent_color, outline_color)
-        self._draw_3d_box(base_x1, base_y1, base_width, 40 * SCALE_FACTOR, base_depth, "machine_bottom_beam", accent_color, outline_color)
+        top_beam_y = MACHINE_Y_TOP_S - 40 * SCALE_FACTOR
+        ids["machine_top_beam"] = self._draw_3d_box(base_x1, top_beam_y, base_width, 40 * SCALE_FACTOR, base_depth, "machine_top_beam", accent_color, outline_color)
+        ids["machine_bottom_beam"] = self._draw_3d_box(base_x1, base_y1, base_width, 40 * SCALE_FACTOR, base_depth, "machine_bottom_beam", accent_color, outline_color)
         
-        # Draw actuator and platens
-        self._draw_3d_box(self.actuator_x * SCALE_FACTOR, self.actuator_y * SCALE_FACTOR, self.actuator_width * SCALE_FACTOR, self.actuator_height * SCALE_FACTOR, 20 * SCALE_FACTOR, "actuator", actuator_color, outline_color)
-
-        platen_x = ((self.machine_x1 + self.machine_x2) / 2 - self.platen_width / 2) * SCALE_FACTOR
+        # Draw platens
+        platen_x = self._platen_x_scaled
         crosshead_y = self.initial_crosshead_y
-        _draw_3d_platen(platen_x, crosshead_y, "crosshead_platen")
+        ids["crosshead_platen"] = _draw_3d_platen(platen_x, crosshead_y, "crosshead_platen")
         
         bottom_platen_y = self.initial_platen_y
-        _draw_3d_platen(platen_x, bottom_platen_y, "bottom_platen")
-        self.canvas.tag_raise("actuator")
-        # Draw piston rod
-        x_piston_center = self.actuator_x * SCALE_FACTOR + self.actuator_width * SCALE_FACTOR / 2
-        self._draw_3d_piston_rod(x_piston_center, self.actuator_y * SCALE_FACTOR + self.actuator_height * SCALE_FACTOR, platen_x + (self.platen_width * SCALE_FACTOR) / 2, crosshead_y, test_type="Compression")
-
-        # Draw the main machine frame LAST to ensure its outlines are on top
-        self._draw_3d_box(base_x1, base_y1 - 400 * SCALE_FACTOR, base_width, 400 * SCALE_FACTOR, base_depth, "machine_frame", main_frame_color, outline_color)
-        
-        # Raise specific elements to ensure proper layering
-        self.canvas.tag_raise("machine_base")
-        self.canvas.tag_raise("col1")
-        self.canvas.tag_raise("col2")
-        self.canvas.tag_raise("machine_top_beam")
-        self.canvas.tag_raise("machine_bottom_beam")
-        self.canvas.tag_raise("crosshead_platen")
-        self.canvas.tag_raise("bottom_platen")
-        self.canvas.tag_raise("actuator_piston")
-        self.canvas.tag_raise("actuator")
+        ids["bottom_platen"] = _draw_3d_platen(platen_x, bottom_platen_y, "bottom_platen")
+        
+        # Draw piston rod, then the actuator on top of it
+        self._draw_3d_piston_rod(self._actuator_x_center_scaled, self._piston_top_y_scaled, self._platen_center_x_scaled, crosshead_y, test_type="Compression")
+        
+        ids["actuator"] = self._draw_3d_box(self.actuator_x * SCALE_FACTOR, self.actuator_y * SCALE_FACTOR, self.actuator_width * SCALE_FACTOR, self.actuator_height * SCALE_FACTOR, 20 * SCALE_FACTOR, "actuator", actuator_color, outline_color)
 
 
     def draw_materials_to_drag(self):
-        for tag in list(self.material_tags.keys()):
-            self.canvas.delete(tag)
-        self.canvas.delete("static_name")
+        """Places every material in the palette, reusing existing canvas items."""
         self.material_tags = {}
         
         start_x, start_y = 70 * SCALE_FACTOR, 240 * SCALE_FACTOR
-        y_offset = 0
-        for name, data in MATERIALS.items():
+        for name, mat in self._mat_cache.items():
+            y_offset = self._palette_y_offsets[name]
             unique_tag = f"draggable_{name}"
-            self.draw_material_shape(start_x, start_y + y_offset, data["dims"], data["color"], data["type"], tags=unique_tag)
-            self.canvas.create_text(start_x + data["dims"][0] * SCALE_FACTOR/2, start_y + y_offset + data["dims"][1] * SCALE_FACTOR + 15 * SCALE_FACTOR, text=name, tags="static_name")
+            self.draw_material_shape(start_x, start_y + y_offset, mat.dims_scaled, mat.color, mat.lighter_color, mat.type, tags=unique_tag)
             
-            self.material_tags[unique_tag] = {"x": start_x, "y": start_y + y_offset, "data": data}
-            y_offset += data["dims"][1] * SCALE_FACTOR + 80 * SCALE_FACTOR
+            label_x = start_x + mat.w_scaled/2
+            label_y = start_y + y_offset + mat.h_scaled + 15 * SCALE_FACTOR
+            items = self.material_items[unique_tag]
+            if "label" in items:
+                self.canvas.coords(items["label"], label_x, label_y)
+            else:
+                items["label"] = self.canvas.create_text(label_x, label_y, text=name, tags="static_name")
+            
+            self.material_tags[unique_tag] = {"x": start_x, "y": start_y + y_offset, "data": mat.data}
+
+    def draw_material_shape(self, x, y, dims_scaled, color, lighter_color, material_type, tags):
+        w, h, d = dims_scaled
+        self._draw_material_faces(x, y, w, h, d, color, lighter_color, material_type, tags)
 
-    def draw_material_shape(self, x, y, dims, color, material_type, tags):
-        w, h, d = [dim * SCALE_FACTOR for dim in dims]
+    def _draw_material_faces(self, x, y, w, h, d, color, lighter_color, material_type, tags):
+        """Draws a material's faces, moving its existing canvas items if it has any."""
+        items = self.material_items.setdefault(tags, {})
+        front_pts, right_pts, top_pts = box_face_coords(x, y, w, h, d)
         
         if material_type == "pipe":
-            # Drawing a pipe as a simple rectangle for now, can be enhanced with arcs if needed
-            self.canvas.create_rectangle(x, y, x + w, y + h, fill=color, outline="black", tags=tags)
+            self._draggable_bboxes[tags] = front_pts
         else:
-            # Front face rectangle
-            self.canvas.create_rectangle(x, y, x + w, y + h, fill=color, outline="black", tags=tags)
+            self._draggable_bboxes[tags] = (x, top_pts[3], top_pts[4], front_pts[3])
+        
+        # Front face rectangle
+        self._upsert_rect(items, "front", front_pts, fill=color, outline="black", tags=tags)
+        # Drawing a pipe as a simple rectangle for now, can be enhanced with arcs if needed
+        if material_type != "pipe":
             # Right side face polygon
-            lighter_color = self.get_lighter_color(color) if self.is_hex_color(color) else color
-            self.canvas.create_polygon(x + w, y, x + w + d, y - d/2, x + w + d, y + h - d/2, x + w, y + h, fill=lighter_color, outline="black", tags=tags)
+            self._upsert_polygon(items, "right", right_pts, fill=lighter_color, outline="black", tags=tags)
             # Top face polygon
-            self.canvas.create_polygon(x, y, x + d, y - d/2, x + w + d, y - d/2, x + w, y, fill=lighter_color, outline="black", tags=tags)
+            self._upsert_polygon(items, "top", top_pts, fill=lighter_color, outline="black", tags=tags)
     
     def on_drag_start(self, event):
-        item = self.canvas.find_closest(event.x, event.y)
-        tags = self.canvas.gettags(item)
-        unique_tag = next((tag for tag in tags if tag.startswith("draggable_")), None)
+        # Hit-test the few draggable materials directly, topmost first
+        ex, ey = event.x, event.y
+        unique_tag = next((tag for tag, (x1, y1, x2, y2) in reversed(self._draggable_bboxes.items())
+                           if x1 <= ex <= x2 and y1 <= ey <= y2), None)
         if unique_tag:
             self.drag_data["item"] = unique_tag
             self.drag_data["x"] = event.x
             self.drag_data["y"] = event.y
+            if self.selected_material_tag is not None:
+                # The GUI stops drawing steps, so Logic can stop publishing them
+                self.event_manager.notify("material_removed")
             self.selected_material_tag = None
+            # Keep material on top during drag; nothing else is raised until release
+            self.canvas.tag_raise(unique_tag)
+            self._zorder_dirty = True
+            self._draggable_bboxes[unique_tag] = self._draggable_bboxes.pop(unique_tag)
 
     def on_drag_motion(self, event):
         if self.drag_data["item"]:
             delta_x = event.x - self.drag_data["x"]
             delta_y = event.y - self.drag_data["y"]
+            if delta_x == 0 and delta_y == 0:
+                return
             self.canvas.move(self.drag_data["item"], delta_x, delta_y)
+            x1, y1, x2, y2 = self._draggable_bboxes[self.drag_data["item"]]
+            self._draggable_bboxes[self.drag_data["item"]] = (x1 + delta_x, y1 + delta_y, x2 + delta_x, y2 + delta_y)
             self.drag_data["x"] = event.x
             self.drag_data["y"] = event.y
-            # Keep material on top during drag
-            self.canvas.tag_raise(self.drag_data["item"])
-
 
     def on_drag_release(self, event):
         if not self.drag_data["item"]:
             return
         
-        items_in_group = self.canvas.find_withtag(self.drag_data["item"])
-        if not items_in_group:
+        bbox = self._draggable_bboxes.get(self.drag_data["item"])
+        if not bbox:
             self.drag_data["item"] = None
             return
 
-        bbox = self.canvas.bbox(self.drag_data["item"])
         center_x = (bbox[0] + bbox[2]) / 2
         
-        if self.machine_area["x1"] * SCALE_FACTOR < center_x < self.machine_area["x2"] * SCALE_FACTOR:
-            material_name = self.drag_data["item"].replace("draggable_", "")
-            mat_data = MATERIALS[material_name]
-            h_scaled = mat_data["dims"][1] * SCALE_FACTOR
-            d_scaled = mat_data["dims"][2] * SCALE_FACTOR
+        if self._machine_x1_scaled < center_x < self._machine_x2_scaled:
+            mat = self._mat_cache[self._tag_to_name[self.drag_data["item"]]]
             
             # Snap material on top of the bottom platen
-            platen_front_x = ((self.machine_x1 + self.machine_x2) / 2 - self.platen_width / 2) * SCALE_FACTOR
             platen_top_y_front = self.initial_platen_y
 
             # Calculate x_snap to align the front face of the material with the front face of the platen
-            x_snap = platen_front_x + (self.platen_width * SCALE_FACTOR - mat_data["dims"][0] * SCALE_FACTOR) / 2 
-            y_snap = platen_top_y_front - h_scaled # Place on top of the front face of the platen
+            x_snap = self._platen_center_x_scaled - mat.w_scaled * 0.5
+            y_snap = platen_top_y_front - mat.h_scaled # Place on top of the front face of the platen
 
-            self.canvas.delete(self.drag_data["item"]) # Delete old elements
-            self.draw_material_shape(x_snap, y_snap, mat_data["dims"], mat_data["color"], mat_data["type"], tags=self.drag_data["item"])
+            self.draw_material_shape(x_snap, y_snap, mat.dims_scaled, mat.color, mat.lighter_color, mat.type, tags=self.drag_data["item"])
             
             self.selected_material_tag = self.drag_data["item"]
-            self.event_manager.notify("material_dropped", {"material_data": mat_data})
+            self._specimen_items = self.material_items[self.selected_material_tag]
+            self.event_manager.notify("material_dropped", {"material_data": mat.data})
             self.enable_buttons()
             
-            # Ensure material is above bottom platen, and crosshead above material
-            self.canvas.tag_raise("bottom_platen")
-            self.canvas.tag_raise(self.selected_material_tag)
-            self.canvas.tag_raise("crosshead_platen")
-            self.canvas.tag_raise("actuator_piston") # Piston rod should also be on top of the crosshead
+            self._restack()
             self.display_message({"text": "Material placed. Use the controls to start the test.", "color": "green"})
         else:
-            material_name = self.drag_data["item"].replace("draggable_", "")
-            mat_data = MATERIALS[material_name]
+            mat = self._mat_cache[self._tag_to_name[self.drag_data["item"]]]
             start_x, start_y = 70 * SCALE_FACTOR, 240 * SCALE_FACTOR
-            y_offset = 0
-            for name, data in MATERIALS.items():
-                if name == material_name:
-                    break
-                y_offset += data["dims"][1] * SCALE_FACTOR + 40 * SCALE_FACTOR
-
-            self.canvas.delete(self.drag_data["item"])
-            self.draw_material_shape(start_x, start_y + y_offset, mat_data["dims"], mat_data["color"], mat_data["type"], tags=self.drag_data["item"])
+            y_offset = self._palette_y_offsets[mat.name]
+
+            self.draw_material_shape(start_x, start_y + y_offset, mat.dims_scaled, mat.color, mat.lighter_color, mat.type, tags=self.drag_data["item"])
             
             self.selected_material_tag = None
             self.disable_buttons()
@@ -677,83 +917,95 @@ class GUI:
         
         self.drag_data["item"] = None
     
-    def _draw_deformed_material(self, x1, y1, width, height, depth, color, material_type, tags):
-        w, h, d = width, height, depth
-        c = color
-        
-        self.canvas.delete(tags)
-        
-        if material_type == "pipe":
-            self.canvas.create_rectangle(x1, y1, x1 + w, y1 + h, fill=c, outline="black", tags=tags)
-        else:
-            # Front face rectangle
-            self.canvas.create_rectangle(x1, y1, x1 + w, y1 + h, fill=c, outline="black", tags=tags)
-            # Right side face polygon
-            lighter_color = self.get_lighter_color(c) if self.is_hex_color(c) else c
-            self.canvas.create_polygon(x1 + w, y1, x1 + w + d, y1 - d/2, x1 + w + d, y1 + h - d/2, x1 + w, y1 + h, fill=lighter_color, outline="black", tags=tags)
-            # Top face polygon
-            self.canvas.create_polygon(x1, y1, x1 + d, y1 - d/2, x1 + w + d, y1 - d/2, x1 + w, y1, fill=lighter_color, outline="black", tags=tags)
+    def _draw_deformed_material(self, x1, y1, width, height, depth):
+        """Moves the placed specimen's existing faces to its deformed size.
 
-    def update_gui(self, data):
+        The face ids are captured on drop; a pipe only has a front face. Colors
+        never change during a test, so only coordinates are touched here.
+        """
+        front_pts, right_pts, top_pts = box_face_coords(x1, y1, width, height, depth)
+        
+        items = self._specimen_items
+        self.canvas.coords(items["front"], *front_pts)
+        if "right" not in items:
+            self._draggable_bboxes[self.selected_material_tag] = front_pts
+            return
+        self.canvas.coords(items["right"], *right_pts)
+        self.canvas.coords(items["top"], *top_pts)
+        self._draggable_bboxes[self.selected_material_tag] = (x1, top_pts[3], top_pts[4], front_pts[3])
+
+    @contextmanager
+    def batch_updates(self):
+        """Groups canvas and label changes so the outermost block flushes them in one repaint."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.canvas.update_idletasks()
+
+    def update_gui(self, state):
         if self.selected_material_tag is None:
             return
         
-        material_height_scaled = data["material_height"]
-        material_width_scaled = data["material_width"]
-        material_depth_scaled = data["material_depth"]
-        crosshead_new_y = data["crosshead_new_y"]
-        current_force = data["current_force"]
-        peak_stress = data["peak_stress"]
-        test_type = data["test_type"]
-
-        platen_x = ((self.machine_x1 + self.machine_x2) / 2 - self.platen_width / 2) * SCALE_FACTOR
-        x1 = platen_x + (self.platen_width * SCALE_FACTOR - material_width_scaled) / 2 # Align material with platen's front face
-        
-        if test_type == "Compression":
-            y1 = self.initial_platen_y - material_height_scaled
-        elif test_type == "Tensile":
-            y1 = self.initial_platen_y - material_height_scaled
-            
-        mat_data = MATERIALS[self.selected_material_tag.replace("draggable_", "")]
-        self._draw_deformed_material(x1, y1, material_width_scaled, material_height_scaled, material_depth_scaled, mat_data["color"], mat_data["type"], tags=self.selected_material_tag)
+        with self.batch_updates():
+            self._apply_step(state)
+
+    def _apply_step(self, state):
+        (material_height_scaled, material_width_scaled, material_depth_scaled,
+         crosshead_new_y, current_force, peak_stress, _) = state
+
+        x1 = self._platen_center_x_scaled - material_width_scaled * 0.5 # Align material with platen's front face
+        y1 = self.initial_platen_y - material_height_scaled # The specimen stands on the bottom platen in both test types
+        
+        self._draw_deformed_material(x1, y1, material_width_scaled, material_height_scaled, material_depth_scaled)
         
-        self.update_crosshead_position({"y": crosshead_new_y, "test_type": test_type})
+        self.update_crosshead_position(crosshead_new_y)
         
-        self.update_data_labels(current_force, peak_stress, data["material_height"] / SCALE_FACTOR)
+        self.update_data_labels(current_force, peak_stress, material_height_scaled / SCALE_FACTOR)
         
+        if self._zorder_dirty:
+            self._restack()
+
+    def _restack(self):
+        """Puts the specimen between the platens; a no-op until something is restacked again."""
+        if not self._zorder_dirty:
+            return
+        # Ensure material is above bottom platen, and crosshead above material
         self.canvas.tag_raise("bottom_platen")
-        self.canvas.tag_raise(self.selected_material_tag)
+        if self.selected_material_tag is not None:
+            self.canvas.tag_raise(self.selected_material_tag)
         self.canvas.tag_raise("crosshead_platen") # this is the moving arm that connect actuator piston with the platen
         self.canvas.tag_raise("actuator_piston") # Ensure piston rod is on top
+        self._zorder_dirty = False
 
-    def update_crosshead_position(self, data):
-        platen_x = ((self.machine_x1 + self.machine_x2) / 2 - self.platen_width / 2) * SCALE_FACTOR
-        y_platen = data["y"]
-        test_type = data["test_type"]
+    def on_crosshead_event(self, data):
+        """Handles Logic's "update_crosshead" event, e.g. after calibration."""
+        self.update_crosshead_position(data["y"])
+
+    def update_crosshead_position(self, y_platen):
+        # Set the crosshead faces directly; the platen is always drawn by draw_machine
+        front, right, top = self._machine_ids["crosshead_platen"]
+        front_pts, right_pts, top_pts = box_face_coords(self._platen_x_scaled, y_platen, PLATTEN_WIDTH_S, PLATTEN_HEIGHT_S, PLATTEN_DEPTH_S)
+        self.canvas.coords(front, *front_pts)
+        self.canvas.coords(right, *right_pts)
+        self.canvas.coords(top, *top_pts)
+        
+        # Piston rod now connects to the current y_platen of the crosshead
+        self.update_piston_length(y_platen)
+        
+    def update_piston_length(self, y_platen):
+        """Stretches the existing piston rod from the actuator down to y_platen.
+
+        The rod hangs from the bottom of the actuator in both test types, so
+        only its length changes and no other geometry needs recomputing.
+        """
+        y_piston_top = self._piston_top_y_scaled
+        if y_platen < y_piston_top:
+            y_piston_top, y_platen = y_platen, y_piston_top
+        self.canvas.coords(self._machine_ids["actuator_piston"], self._piston_x1_scaled, y_piston_top, self._piston_x2_scaled, y_platen)
 
-        platen_bbox = self.canvas.bbox("crosshead_platen")
-        
-        if platen_bbox:
-            dy = y_platen - platen_bbox[1]
-            self.canvas.move("crosshead_platen", 0, dy)
-        else:
-            # If platen not yet drawn, create it.
-            self.canvas.create_rectangle(platen_x, y_platen, platen_x + self.platen_width * SCALE_FACTOR, y_platen + self.platen_height * SCALE_FACTOR, fill="#3498DB", outline="#2980B9", width=2, tags="crosshead_platen")
-        
-        x_piston_center = self.actuator_x * SCALE_FACTOR + self.actuator_width * SCALE_FACTOR / 2
-        
-        if test_type == "Compression":
-            y_piston_top = self.actuator_y * SCALE_FACTOR + self.actuator_height * SCALE_FACTOR
-            # Piston rod now connects to the current y_platen of the crosshead
-            self._draw_3d_piston_rod(x_piston_center, y_piston_top, platen_x + (self.platen_width * SCALE_FACTOR) / 2, y_platen, test_type="Compression")
-        elif test_type == "Tensile":
-            y_piston_top = (self.machine_y_top+10) * SCALE_FACTOR + 20 * SCALE_FACTOR
-            # Piston rod now connects to the current y_platen of the crosshead
-            self._draw_3d_piston_rod(x_piston_center, y_piston_top, platen_x + (self.platen_width * SCALE_FACTOR) / 2, y_platen, test_type="Tensile")
-        
-        self.canvas.tag_raise("crosshead_platen")
-        self.canvas.tag_raise("actuator_piston") # Ensure piston rod is on top
-        
     def enable_buttons(self):
         self.calibrate_button.config(state=tk.NORMAL)
         self.start_button.config(state=tk.NORMAL)
@@ -767,39 +1019,49 @@ class GUI:
         self.reset_button.config(state=tk.DISABLED)
         
     def set_status(self, status):
-        if status == "running":
-            self.start_button.config(state=tk.DISABLED)
-            self.pause_button.config(text="Pause Test", command=lambda: self.event_manager.notify("pause_test"), state=tk.NORMAL)
-            self.reset_button.config(state=tk.DISABLED)
-            self.light_canvas.itemconfig(self.status_light, fill="#e74c3c", outline="#c0392b")
-        elif status == "paused":
-            self.pause_button.config(text="Resume Test", command=lambda: self.event_manager.notify("resume_test"))
-            self.reset_button.config(state=tk.NORMAL)
-            self.light_canvas.itemconfig(self.status_light, fill="#f1c40f", outline="#f39c12")
-        elif status == "finished":
-            self.start_button.config(state=tk.DISABLED)
-            self.pause_button.config(text="Test Finished", state=tk.DISABLED)
-            self.reset_button.config(state=tk.NORMAL)
-            self.light_canvas.itemconfig(self.status_light, fill="#2ecc71", outline="#27ae60")
+        with self.batch_updates():
+            if status == "running":
+                self.start_button.config(state=tk.DISABLED)
+                self.pause_button.config(text="Pause Test", command=self._on_pause, state=tk.NORMAL)
+                self.reset_button.config(state=tk.DISABLED)
+                self.light_canvas.itemconfig(self.status_light, fill="#e74c3c", outline="#c0392b")
+            elif status == "paused":
+                self.pause_button.config(text="Resume Test", command=self._on_resume)
+                self.reset_button.config(state=tk.NORMAL)
+                self.light_canvas.itemconfig(self.status_light, fill="#f1c40f", outline="#f39c12")
+            elif status == "finished":
+                self.start_button.config(state=tk.DISABLED)
+                self.pause_button.config(text="Test Finished", state=tk.DISABLED)
+                self.reset_button.config(state=tk.NORMAL)
+                self.light_canvas.itemconfig(self.status_light, fill="#2ecc71", outline="#27ae60")
         
     def update_data_labels(self, force, stress, height):
-        self.force_label.config(text=f"Force: {force:.2f} N")
-        self.stress_label.config(text=f"Stress: {stress:.2f} MPa")
-        self.dim_label.config(text=f"New Dims: {height:.2f} mm (H)")
+        # Labels show two decimals; only reconfigure those whose shown value changed
+        force, stress, height = round(force, 2), round(stress, 2), round(height, 2)
+        if force != self._last_force:
+            self._last_force = force
+            self.force_label.config(text=f"Force: {force:.2f} N")
+        if stress != self._last_stress:
+            self._last_stress = stress
+            self.stress_label.config(text=f"Stress: {stress:.2f} MPa")
+        if height != self._last_height:
+            self._last_height = height
+            self.dim_label.config(text=f"New Dims: {height:.2f} mm (H)")
 
     def full_reset(self, data=None):
-        if self.selected_material_tag:
-            self.canvas.delete(self.selected_material_tag)
-            self.selected_material_tag = None
+        # The placed material is moved back to the palette with the others
+        self.selected_material_tag = None
         
         self.draw_materials_to_drag()
         self.disable_buttons()
         self.start_button.config(text="Start Test")
-        self.pause_button.config(text="Pause Test", command=lambda: self.event_manager.notify("pause_test"))
+        self.pause_button.config(text="Pause Test", command=self._on_pause)
         self.update_data_labels(0, 0, 0)
         
         initial_crosshead_y = data.get("initial_crosshead_y", self.initial_crosshead_y)
-        self.update_crosshead_position({"y": initial_crosshead_y, "test_type": self.test_type_var.get()})
+        self.update_crosshead_position(initial_crosshead_y)
+        self._zorder_dirty = True
+        self._restack()
 
 # -----------------------------------------------------------------------------
 # Main Application
@@ -807,8 +1069,10 @@ class GUI:
 def main():
     root = tk.Tk()
     event_manager = EventManager()
-    logic = Logic(root, event_manager)
-    gui = GUI(root, event_manager)
+    state_slot = queue.Queue(maxsize=1)
+    logic = Logic(root, event_manager, state_slot)
+    threading.Thread(target=logic.run_loop, daemon=True).start()
+    gui = GUI(root, event_manager, state_slot)
     root.mainloop()
 
 if __name__ == "__main__":